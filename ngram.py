@@ -56,7 +56,7 @@ data_path.mkdir(exist_ok=True)
 def model_names():
     """ Helper method to fetch the names of models using Pathlib """
     return [
-        content.name.rstrip(".json")
+        content.stem
         for content in data_path.iterdir()
         if content.suffix == ".json"
     ]
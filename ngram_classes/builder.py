@@ -4,12 +4,24 @@ from __future__ import annotations
 
 import io
 import re
+import sys
 import json
-import string
 
-from copy import deepcopy
-from collections import defaultdict
-from unidecode import unidecode
+from collections import Counter, defaultdict
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One token is an ellipsis, the 't contraction suffix, a run of letters and
+# digits, or any other single non-space character (punctuation).
+_TOKEN_RE = re.compile(r"\.\.\.|'t|[a-z0-9]+|\S")
+
+# Trailing run of non-space characters: a token that may continue into the
+# next chunk when a file is read in pieces.
+_TAIL_RE = re.compile(r"\S+\Z")
 
 class NGramBuilder:
     """ N-GRAM BUILDER
@@ -46,8 +58,9 @@ class NGramBuilder:
     def __init__(self, param_n: int):
         """ Initializes an Ngram model using a value of n """
         self.param_n = param_n
-        self.vocab = defaultdict(int)
-        self.model = defaultdict(lambda: defaultdict(int))
+        self.vocab = Counter()
+        self.model = defaultdict(Counter)
+        self._windows = NGramBuilder._specialize_windows(param_n)
 
 
     def add_source(self, text: str) -> None:
@@ -57,22 +70,42 @@ class NGramBuilder:
             Returns: None
         """
         tokens = NGramBuilder.generate_tokens(text)
-        offsetted_sequences = [
-            tokens[offset:]
-            for offset in range(self.param_n)
-        ]
 
-        for token_tuple in zip(*offsetted_sequences):
-            *key_tokens, next_token = token_tuple
-            key = " ".join(key_tokens)
-            self.model[key][next_token] += 1
+        self._absorb_window_counts(
+            NGramBuilder._count_ngrams(tokens, self.param_n)
+        )
+        self.vocab.update(tokens[:self.param_n - 1])
 
-        for token in tokens:
-            self.vocab[token] += 1
+
+    def add_tokens(self, tokens) -> None:
+        """ ADD TOKENS: Trains the model on a stream of tokens.
+            Consumes the tokens one at a time through a sliding window, so an
+            arbitrarily long stream is counted in O(N) memory beyond the
+            model itself.
+            Arguments:
+                - tokens (iterable of str): The tokens of a training document,
+                    in document order
+            Returns: None
+        """
+        self._absorb_window_counts(Counter(self._windows(self.vocab, tokens)))
+
+
+    def _absorb_window_counts(self, window_counts: Counter) -> None:
+        """ ABSORB WINDOW COUNTS: Helper method folding counted windows into
+            the model and the vocabulary in one pass. Every token occurrence
+            except a document's first N-1 is the final token of exactly one
+            window, so vocabulary counts ride along with the window merge and
+            the callers only top up those N-1 head tokens.
+        """
+        for token_tuple, count in window_counts.items():
+            self.model[token_tuple[:-1]][token_tuple[-1]] += count
+            self.vocab[token_tuple[-1]] += count
 
 
     def add_from_file(self, sourcefile: str|io.TextIOWrapper) -> None:
         """ ADD FROM FILE: Trains the model on the contents of a source file.
+            The file is read and tokenized in chunks, so training does not
+            need the whole document in memory at once.
             Arguments:
                 - sourcefile (str | io.TextIOWraper): File for training, which
                     should contain the text for training the file. Either the
@@ -82,18 +115,42 @@ class NGramBuilder:
         """
         if isinstance(sourcefile, str):
             with open(sourcefile, "r") as wrapper:
-                source = wrapper.read()
+                self.add_tokens(NGramBuilder._stream_tokens(wrapper))
 
         elif isinstance(sourcefile, io.TextIOWrapper):
             try:
-                source = sourcefile.read()
+                self.add_tokens(NGramBuilder._stream_tokens(sourcefile))
 
             except ValueError as file_object_value_error:
                 raise ValueError(
                     f"Cannot add source from file: {file_object_value_error}"
                 ) from file_object_value_error
 
-        self.add_source(source)
+
+    @staticmethod
+    def _stream_tokens(wrapper: io.TextIOWrapper, chunk_size: int = 1 << 20):
+        """ STREAM TOKENS: Static helper method for tokenizing a file lazily
+        Reads the file chunk by chunk and yields the tokens of each chunk,
+        holding back any trailing partial token until the next chunk arrives.
+        Arguments:
+            - wrapper (io.TextIOWrapper): An open file to tokenize
+            - chunk_size (int): Number of characters to read per chunk
+        Yields:
+            - tokens (str): The tokens of the file, in document order
+        """
+        carry = ""
+        for chunk in iter(lambda: wrapper.read(chunk_size), ""):
+            text = carry + chunk
+            tail = _TAIL_RE.search(text)
+            if tail:
+                carry = tail.group()
+                text = text[:tail.start()]
+            else:
+                carry = ""
+            yield from NGramBuilder.generate_tokens(text)
+
+        if carry:
+            yield from NGramBuilder.generate_tokens(carry)
 
 
     def save(self, modelfile: str|io.TextIOWrapper) -> None:
@@ -106,11 +163,11 @@ class NGramBuilder:
         """
         if isinstance(modelfile, str):
             with open(modelfile, "w") as file_object:
-                json.dump(self.data, file_object, indent=2)
+                file_object.write(self._serialize())
 
         elif isinstance(modelfile, io.TextIOWrapper):
             try:
-                json.dump(self.data, modelfile, indent=2)
+                modelfile.write(self._serialize())
             except ValueError as unwritable_file:
                 raise ValueError(
                     f"Cannot save: '{modelfile.name}' is either closed or open"
@@ -123,6 +180,18 @@ class NGramBuilder:
             )
 
 
+    def _serialize(self) -> str:
+        """ SERIALIZE: Helper method rendering the model data as JSON text.
+            Uses orjson (a C-implemented serializer) when it is installed,
+            and falls back to the standard library otherwise; the output
+            format is the same either way.
+        """
+        if orjson is not None:
+            return orjson.dumps(self.data, option=orjson.OPT_INDENT_2).decode()
+
+        return json.dumps(self.data, indent=2)
+
+
     def copy(self) -> NGramBuilder:
         """ COPY: Creates a deep copy of this object.
             Arguments: None
@@ -131,8 +200,13 @@ class NGramBuilder:
                     the same values of the `n`, `model`, and `vocab` fields.
         """
         duplicate = NGramBuilder(param_n=self.param_n)
-        duplicate.vocab = deepcopy(self.vocab)
-        duplicate.model = deepcopy(self.model)
+
+        # Keys and counts are immutable, so rebuilding the two table levels
+        # is a full copy; deepcopy's memo machinery is not needed here.
+        duplicate.vocab = Counter(self.vocab)
+        for key, next_tokens in self.model.items():
+            duplicate.model[key] = Counter(next_tokens)
+
         return duplicate
 
 
@@ -147,19 +221,97 @@ class NGramBuilder:
                 result (NGramBuilder): A new model which has learned the
                 combined learning data of both the operand models.
         """
-        if self.param_n != other_builder.n:
+        if self.param_n != other_builder.param_n:
             raise ValueError("Adding Incompatible Models: N not same.")
 
-        duplicate = self.copy()
+        result = NGramBuilder(param_n=self.param_n)
+        result._merge_from(self)
+        result._merge_from(other_builder)
+        return result
 
-        for token, count in other_builder.vocab.items():
-            duplicate.vocab[token] += count
 
-        for key, next_tokens in other_builder.model.items():
-            for token, count in next_tokens.items():
-                duplicate.model[key][token] += count
+    def _merge_from(self, source: NGramBuilder) -> None:
+        """ MERGE FROM: Helper method folding another builder's counts into
+            this one, one pass over the source tables. Fresh keys bind a new
+            Counter directly; existing keys are summed through the C-level
+            Counter.update.
+        """
+        self.vocab.update(source.vocab)
 
-        return duplicate
+        for key, next_tokens in source.model.items():
+            existing = self.model.get(key)
+            if existing is None:
+                self.model[key] = Counter(next_tokens)
+            else:
+                existing.update(next_tokens)
+
+
+    @staticmethod
+    def _specialize_windows(param_n: int):
+        """ SPECIALIZE WINDOWS: Static helper method that compiles a sliding-
+        window generator specialized to one value of N. Because N is fixed
+        per builder, the window can live in N rolling local variables and be
+        yielded as a literal tuple, instead of paying a deque append and a
+        tuple() call for every token of the stream. The first N-1 tokens of
+        the stream are counted straight into the vocabulary; every later
+        token is the final token of the window it completes.
+        Arguments:
+            - param_n (int): The context length N to specialize for
+        Returns:
+            - _windows (function): A generator function taking (vocab,
+                tokens) and yielding each N-token window as a tuple
+        """
+        heads = "".join(
+            f"    for t{i} in iterator:\n"
+            f"        vocab[t{i}] += 1\n"
+            f"        break\n"
+            f"    else:\n"
+            f"        return\n"
+            for i in range(param_n - 1)
+        )
+        window_vars = ", ".join(f"t{i}" for i in range(param_n))
+        if param_n == 1:
+            window_vars += ","
+        shift = ""
+        if param_n > 1:
+            shift_dest = ", ".join(f"t{i}" for i in range(param_n - 1))
+            shift_src = ", ".join(f"t{i}" for i in range(1, param_n))
+            shift = f"        {shift_dest} = {shift_src}\n"
+
+        source = (
+            "def _windows(vocab, tokens):\n"
+            "    iterator = iter(tokens)\n"
+            f"{heads}"
+            f"    for t{param_n - 1} in iterator:\n"
+            f"        yield ({window_vars})\n"
+            f"{shift}"
+        )
+        namespace = {}
+        exec(source, namespace)
+        return namespace["_windows"]
+
+
+    @staticmethod
+    def _count_ngrams(tokens: list[str], param_n: int) -> Counter:
+        """ COUNT NGRAMS: Static helper method for the counting hot loop
+        Arguments:
+            - tokens (list[str]): The tokenized training document
+            - param_n (int): The context length N of the n-grams to count
+        Returns:
+            - window_counts (Counter): Counts of each N-token window, keyed
+                by the window as a tuple of tokens
+        """
+        # islice walks the token list from each offset without copying it,
+        # where tokens[offset:] would allocate param_n nearly-full lists.
+        offsetted_sequences = [
+            islice(tokens, offset, None)
+            for offset in range(param_n)
+        ]
+
+        # One C-level pass over the zipped offset sequences; the caller then
+        # folds only the (much smaller) table of unique windows into the
+        # model, instead of doing one dict update per window at Python level.
+        return Counter(zip(*offsetted_sequences))
 
 
     @staticmethod
@@ -170,12 +322,19 @@ class NGramBuilder:
         Returns:
             - tokens (list[str]): A list of token strings (words or punctuation)
         """
-        precleaned = unidecode(text).lower()
-        punctspace = re.sub(f"([{string.punctuation}])", r" \g<0> ", precleaned)
-        ellipsis_restored = punctspace.replace(". . .", "...")
-        quote_t_restored = ellipsis_restored.replace(" 't", "'t")
-        single_spaces = re.sub(r"\s+", " ", quote_t_restored)
-        return single_spaces.split()
+        if text.isascii():
+            # Already-ASCII text (the common case for training corpora) can
+            # skip transliteration; isascii and lower both run as C-level
+            # scans. unidecode is imported only when actually needed.
+            precleaned = text.lower()
+        else:
+            from unidecode import unidecode
+            precleaned = unidecode(text).lower()
+
+        # Interning collapses every occurrence of a token to one shared
+        # string object, so the token list, vocab, and model keys all point
+        # at a single copy and dict lookups hash each token only once.
+        return [sys.intern(token) for token in _TOKEN_RE.findall(precleaned)]
 
 
     @property
@@ -185,5 +344,5 @@ class NGramBuilder:
         """
         return {
             "vocab": dict(self.vocab),
-            "model": {k: dict(v) for k, v in self.model.items()}
+            "model": {" ".join(key): dict(v) for key, v in self.model.items()}
         }
@@ -4,9 +4,41 @@ from __future__ import annotations
 from typing import Self
 
 import io
+import sys
 import json
 import random
 
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, islice
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Number of tokens generated per internal refill of the iteration buffer.
+_REFILL_SIZE = 64
+
+# Per-process generator used by the generate_many worker pool; each worker
+# loads the (read-only) model once in its initializer and reuses it for every
+# stream it is handed.
+_worker_generator = None
+
+
+def _init_worker(data: dict[str, dict]) -> None:
+    """ Pool initializer building one generator per worker process """
+    global _worker_generator
+    _worker_generator = NGramGenerator()
+    _worker_generator.load_model(data)
+
+
+def _generate_stream(task: tuple) -> list[str]:
+    """ Pool task generating one token stream on the worker's generator """
+    prefix, length = task
+    return list(islice(_worker_generator(prefix), length))
+
 class NGramGenerator:
     """ N-GRAM GENERATOR
     Class for running prediction and autoregression tasks
@@ -31,15 +63,31 @@ class NGramGenerator:
             if terminating_condition():
                 break
         print()
+
+    All sampling runs on cumulative-count and alias tables, so memory is
+    proportional to the number of distinct tokens and continuations -- never
+    to the total occurrence counts, however large the training corpus was.
     """
 
+    __slots__ = (
+        'param_n', 'vocab', 'model', 'state', 'vocab_tokens',
+        '_alias_prob', '_alias_idx', '_samplers', '_fallback_sampler',
+        '_buffer'
+    )
+
+
     def __init__(self):
         """ Initializes the autoregressor with empty fields """
         self.param_n = None
         self.vocab = None
         self.model = None
         self.state = None
-        self.vocab_spreadout = None
+        self.vocab_tokens = None
+        self._alias_prob = None
+        self._alias_idx = None
+        self._samplers = {}
+        self._fallback_sampler = None
+        self._buffer = deque()
 
 
     def load_file(self, modelfile: str|io.TextIOWrapper) -> None:
@@ -53,7 +101,7 @@ class NGramGenerator:
         if isinstance(modelfile, str):
             try:
                 with open(modelfile) as sourcefile:
-                    data = json.load(sourcefile)
+                    data = NGramGenerator._parse(sourcefile.read())
 
             except FileNotFoundError as nonexistent_file:
                 raise FileNotFoundError(
@@ -69,7 +117,7 @@ class NGramGenerator:
 
         if isinstance(modelfile, io.TextIOWrapper):
             try:
-                data = json.load(modelfile)
+                data = NGramGenerator._parse(modelfile.read())
 
             except json.JSONDecodeError as broken_json:
                 raise ValueError(
@@ -81,6 +129,20 @@ class NGramGenerator:
         self.load_model(data)
 
 
+    @staticmethod
+    def _parse(text: str) -> dict[str, dict]:
+        """ PARSE: Static helper method decoding model JSON text.
+            Uses orjson (a C-implemented parser) when it is installed, and
+            falls back to the standard library otherwise; orjson's decode
+            errors subclass json.JSONDecodeError, so the callers' error
+            handling covers both.
+        """
+        if orjson is not None:
+            return orjson.loads(text)
+
+        return json.loads(text)
+
+
     def load_model(self, data: dict[str, dict]) -> None:
         """ LOAD MODEL: Loads an n-gram model from its dictionary format
             This will add the model's data into this model.
@@ -89,20 +151,61 @@ class NGramGenerator:
             Returns: None
         """
         try:
-            self.vocab = data["vocab"]
-            self.model = data["model"]
-            self.vocab_spreadout = []
-            for token, count in self.vocab.items():
-                self.vocab_spreadout.extend([token] * count)
-
-            key_sizes = [
-                len(keyphrase.split())
-                for keyphrase in self.model.keys()
-            ]
-            unique_key_sizes = list(set(key_sizes))
-            if len(unique_key_sizes) != 1:
-                raise ValueError("Broken model file: non-uniform parameter N")
-            self.param_n = unique_key_sizes[0] + 1
+            vocab = data["vocab"]
+            model = data["model"]
+
+            # One key is enough to establish N; the merge loop below already
+            # splits every key once, so uniformity is checked there instead
+            # of in a separate pass over the whole model.
+            first_key = next(iter(model), None)
+            if first_key is None:
+                raise ValueError("Broken model file: no n-gram entries")
+            tentative_n = len(first_key.split()) + 1
+            if self.param_n not in (None, tentative_n):
+                raise ValueError(
+                    "Cannot merge models with different parameter N"
+                )
+            self.param_n = tentative_n
+
+            # Counts merge into any previously loaded model through
+            # Counter.update, which sums entire tables in C instead of one
+            # Python-level increment per entry.
+            if self.vocab is None:
+                self.vocab = Counter()
+                self.model = {}
+
+            # Model keys are stored as token tuples, so lookups during
+            # generation use the state tokens directly instead of building a
+            # space-joined string per step; keys are split exactly once here.
+            # Interning every token collapses the duplicates across the
+            # vocabulary, keys, and continuation tables to single shared
+            # objects with cached hashes, which also makes the pointer-equal
+            # fast path of dict lookup hit once generated tokens cycle back
+            # into the state.
+            self.vocab.update({
+                sys.intern(token): count
+                for token, count in vocab.items()
+            })
+            for keyphrase, next_tokens in model.items():
+                key = tuple(
+                    sys.intern(part) for part in keyphrase.split()
+                )
+                if len(key) != self.param_n - 1:
+                    raise ValueError(
+                        "Broken model file: non-uniform parameter N"
+                    )
+                interned = {
+                    sys.intern(token): count
+                    for token, count in next_tokens.items()
+                }
+                existing = self.model.get(key)
+                if existing is None:
+                    self.model[key] = Counter(interned)
+                else:
+                    existing.update(interned)
+
+            self._build_vocab_alias()
+            self._freeze()
 
         except KeyError as missing_field:
             self.param_n, self.vocab, self.model = None, None, None
@@ -115,6 +218,68 @@ class NGramGenerator:
             raise broken_model_file_error
 
 
+    def _freeze(self) -> None:
+        """ FREEZE: Helper method precomputing one sampler closure for every
+            keyphrase after a load. The model is read-only between loads, so
+            building all distributions up front means the generation loop
+            never constructs anything mid-stream -- each step is a dict
+            lookup and a closure call over already-built tables.
+        """
+        self._samplers = {
+            key: NGramGenerator._make_sampler(next_tokens)
+            for key, next_tokens in self.model.items()
+        }
+
+
+    def _build_vocab_alias(self) -> None:
+        """ BUILD VOCAB ALIAS: Helper method setting up Walker's alias method
+            for the whole-vocabulary fallback distribution. Construction is
+            one O(V) pass (Vose's two-stack variant) and every draw afterward
+            costs one random index plus one random comparison -- no pool
+            expansion and no binary search.
+        """
+        self.vocab_tokens = list(self.vocab.keys())
+        counts = list(self.vocab.values())
+        size = len(counts)
+        total = sum(counts)
+
+        scaled = [count * size / total for count in counts]
+        self._alias_prob = [0.0] * size
+        self._alias_idx = list(range(size))
+
+        small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+
+        while small and large:
+            lo = small.pop()
+            hi = large.pop()
+            self._alias_prob[lo] = scaled[lo]
+            self._alias_idx[lo] = hi
+            scaled[hi] += scaled[lo] - 1.0
+            if scaled[hi] < 1.0:
+                small.append(hi)
+            else:
+                large.append(hi)
+
+        # Entries left on either stack have weight 1 up to rounding error.
+        for i in small + large:
+            self._alias_prob[i] = 1.0
+
+        # The fallback draw is packaged as a closure with its tables bound as
+        # default arguments, so the hot loop reads them as local variables.
+        def fallback_sampler(
+            tokens=self.vocab_tokens, prob=self._alias_prob,
+            alias=self._alias_idx, size=size,
+            randrange=random.randrange, uniform=random.random
+        ):
+            slot = randrange(size)
+            if uniform() < prob[slot]:
+                return tokens[slot]
+            return tokens[alias[slot]]
+
+        self._fallback_sampler = fallback_sampler
+
+
     def predict(self, init_key: str|tuple[str]|list[str]) -> str:
         """ PREDICT
         Predicts the next token from a given number of tokens
@@ -126,7 +291,7 @@ class NGramGenerator:
         """
         if any((
             self.vocab is None, self.param_n is None,
-            self.model is None, self.vocab_spreadout is None
+            self.model is None, self._alias_prob is None
         )):
             raise ValueError("Cannot predict without loading a model!")
 
@@ -136,14 +301,41 @@ class NGramGenerator:
         if len(init_key) != self.param_n - 1:
             raise ValueError("Initial Phrase must have (N - 1) tokens")
 
-        keyphrase = ' '.join(init_key)
-        if keyphrase in self.model:
-            spreadout = []
-            for token, count in self.model[keyphrase].items():
-                spreadout.extend([token] * count)
-            return random.choice(spreadout)
+        return self._sample(tuple(init_key))
+
+
+    def _sample(self, key: tuple) -> str:
+        """ SAMPLE: Helper method drawing the next token for a state tuple.
+            Every keyphrase's sampler closure exists from load time (see
+            _freeze); unseen keyphrases fall back to the whole-vocabulary
+            alias sampler.
+        """
+        sampler = self._samplers.get(key)
+        if sampler is None:
+            return self._fallback_sampler()
+
+        return sampler()
+
+
+    @staticmethod
+    def _make_sampler(next_tokens: dict[str, int]):
+        """ MAKE SAMPLER: Static helper method baking one keyphrase's
+            continuation distribution into a closure. The token list,
+            cumulative counts, and the bisect and random functions are bound
+            as default arguments, so a steady-state draw is one function
+            call, one random number, and one binary search over locals.
+        """
+        tokens = list(next_tokens.keys())
+        cum_counts = list(accumulate(next_tokens.values()))
+        total = cum_counts[-1]
+
+        def sampler(
+            tokens=tokens, cum_counts=cum_counts, total=total,
+            search=bisect_right, uniform=random.random
+        ):
+            return tokens[search(cum_counts, uniform() * total)]
 
-        return random.choice(self.vocab_spreadout)
+        return sampler
 
 
     def __call__(self, init_key: str|tuple[str]|list[str]) -> Self:
@@ -158,20 +350,17 @@ class NGramGenerator:
             Returns:
                 - self: Returns this object itself (by reference)
         """
-        if isinstance(init_key, str):
-            self.state = init_key.split()
-
-        if isinstance(init_key, list):
-            self.state = [*init_key]
-
-        if isinstance(init_key, tuple):
-            self.state = list(init_key)
+        tokens = init_key.split() if isinstance(init_key, str) else init_key
 
-        if len(self.state) != self.param_n - 1:
+        if len(tokens) != self.param_n - 1:
             raise ValueError(
-                f"Starting phrase {self.state} does not have (N -1) tokens"
+                f"Starting phrase {tokens} does not have (N -1) tokens"
             )
 
+        # A deque with maxlen evicts its head in O(1) when a new token is
+        # appended, unlike list.pop(0) which shifts every element.
+        self.state = deque(tokens, maxlen=self.param_n - 1)
+        self._buffer.clear()
         return self
 
 
@@ -181,12 +370,71 @@ class NGramGenerator:
 
 
     def __next__(self) -> str:
-        """ Compute next token, update its state, and then return that token"""
+        """ Return the next token, refilling the internal buffer as needed """
         if self.state is None:
             raise StopIteration
 
-        keyphrase = ' '.join(self.state)
-        next_token = self.predict(keyphrase)
-        self.state.pop(0)
-        self.state.append(next_token)
-        return next_token
+        if not self._buffer:
+            self._refill()
+        return self._buffer.popleft()
+
+
+    def _refill(self) -> None:
+        """ REFILL: Helper method advancing the autoregressor by a whole
+            batch of tokens at once. Running the sample-and-advance loop over
+            local names amortizes the attribute lookups of one-token-at-a-
+            time iteration across _REFILL_SIZE tokens; __next__ then hands
+            tokens out of the buffer until it runs dry. Exactly one token
+            rolls in and one rolls out per step, so the lookup key is updated
+            incrementally rather than rebuilt from the state each time.
+        """
+        state = self.state
+        get_sampler = self._samplers.get
+        fallback = self._fallback_sampler
+        advance = state.append
+        buffered = self._buffer.append
+        rolling = self.param_n > 1
+
+        key = tuple(state)
+        for _ in range(_REFILL_SIZE):
+            sampler = get_sampler(key)
+            next_token = sampler() if sampler is not None else fallback()
+            if rolling:
+                key = key[1:] + (next_token,)
+            advance(next_token)
+            buffered(next_token)
+
+
+    def generate_many(
+        self, prefixes: list[str|tuple[str]|list[str]], length: int
+    ) -> list[list[str]]:
+        """ GENERATE MANY: Generates several independent token streams in
+            parallel, one per starting phrase, across CPU cores. The model is
+            read-only during generation, so the streams do not contend; each
+            worker process loads the model once and serves a share of the
+            streams.
+            Arguments:
+                - prefixes (list): Starting phrases, each in any form
+                    accepted by __call__ (string, list, or tuple of
+                    (N - 1) tokens)
+                - length (int): Number of tokens to generate per stream
+            Returns:
+                - streams (list[list[str]]): One token list per prefix, in
+                    the order the prefixes were given
+        """
+        if self.model is None:
+            raise ValueError("Cannot generate without loading a model!")
+
+        data = {
+            "vocab": dict(self.vocab),
+            "model": {
+                " ".join(key): dict(next_tokens)
+                for key, next_tokens in self.model.items()
+            }
+        }
+
+        tasks = [(prefix, length) for prefix in prefixes]
+        with ProcessPoolExecutor(
+            initializer=_init_worker, initargs=(data,)
+        ) as executor:
+            return list(executor.map(_generate_stream, tasks))